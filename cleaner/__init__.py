@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Callable, Optional
+
 from .config import CleanerConfig, load_config
 
 __all__ = ["CleanerConfig", "load_config", "start_hotkey_listener"]
 
 
-def start_hotkey_listener(config: CleanerConfig) -> None:
+def start_hotkey_listener(
+    config: CleanerConfig,
+    config_path: Optional[Path] = None,
+    transform: Optional[Callable[[CleanerConfig], CleanerConfig]] = None,
+) -> None:
     """Import the hotkey runner lazily to avoid heavy dependencies at import time."""
 
     from .runner import start_hotkey_listener as _start_hotkey_listener
 
-    _start_hotkey_listener(config)
+    _start_hotkey_listener(config, config_path, transform)
@@ -84,6 +84,10 @@ def apply_overrides(config: CleanerConfig, args: argparse.Namespace) -> CleanerC
         delete_folder_itself=delete_folder_itself,
         recreate_folder=recreate_folder,
         suppress_notifications=config.suppress_notifications,
+        schedule=config.schedule,
+        schedule_windows=config.schedule_windows,
+        schedule_jitter_seconds=config.schedule_jitter_seconds,
+        schedule_small_run_seconds=config.schedule_small_run_seconds,
     )
 
 
@@ -97,7 +101,11 @@ def main() -> None:
     config = load_config(args.config)
     config = apply_overrides(config, args)
 
-    start_hotkey_listener(config)
+    start_hotkey_listener(
+        config,
+        config_path=args.config,
+        transform=lambda reloaded: apply_overrides(reloaded, args),
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover - manual invocation
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import ctypes
+import errno
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 try:
     from send2trash import send2trash
@@ -15,6 +17,18 @@ except ImportError:  # pragma: no cover - dependency should be installed by the
 
 LOGGER = logging.getLogger(__name__)
 
+# Same capability check shutil.rmtree uses for its symlink attack resistant
+# implementation; true on Linux, false on Windows.
+_USE_FD_FUNCTIONS = (
+    {os.open, os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+    and os.stat in os.supports_follow_symlinks
+)
+
+_O_DIRECTORY_NOFOLLOW = (
+    os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+)
+
 
 def _iter_children(folder: Path) -> Iterable[Path]:
     if not folder.exists():
@@ -35,6 +49,14 @@ def delete_folder_contents(
     """Delete the contents of *folder* using the configured strategy."""
 
     folder = folder.resolve()
+    if not send_to_recycle_bin and _USE_FD_FUNCTIONS:
+        _delete_folder_contents_fd(
+            folder,
+            delete_folder_itself=delete_folder_itself,
+            recreate_folder=recreate_folder,
+        )
+        return
+
     if not folder.exists():
         LOGGER.info("Folder '%s' does not exist; nothing to delete.", folder)
         if recreate_folder:
@@ -75,6 +97,144 @@ def _delete_path(path: Path, *, send_to_recycle_bin: bool) -> None:
             path.unlink(missing_ok=True)
 
 
+def _delete_folder_contents_fd(
+    folder: Path,
+    *,
+    delete_folder_itself: bool,
+    recreate_folder: bool,
+) -> None:
+    """Permanently delete *folder* or its contents relative to directory descriptors.
+
+    The folder is opened once and everything below it is removed with
+    ``unlinkat``/``rmdir`` relative to the open parent, so no full path is
+    resolved again and a directory swapped for a symlink mid-walk is unlinked
+    rather than followed.
+    """
+
+    open_path = folder.parent if delete_folder_itself else folder
+    try:
+        dir_fd = os.open(open_path, _O_DIRECTORY_NOFOLLOW)
+    except FileNotFoundError:
+        dir_fd = None
+
+    try:
+        if dir_fd is not None and delete_folder_itself:
+            LOGGER.info("Removing folder of '%s'.", folder)
+            removed = _remove_entry_fd(folder.name, dir_fd)
+        elif dir_fd is not None:
+            LOGGER.info("Removing contents of '%s'.", folder)
+            _clear_directory_fd(dir_fd)
+            removed = True
+        else:
+            removed = False
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    if not removed:
+        LOGGER.info("Folder '%s' does not exist; nothing to delete.", folder)
+    if recreate_folder and (delete_folder_itself or not removed):
+        LOGGER.debug("Creating folder '%s'.", folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+
+def _remove_entry_fd(name: str, dir_fd: int) -> bool:
+    """Remove *name* inside *dir_fd*, recursing into directories. Return ``False`` if missing."""
+
+    try:
+        child_fd = os.open(name, _O_DIRECTORY_NOFOLLOW, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return False
+    except OSError as exc:
+        # ENOTDIR for files; ELOOP when O_NOFOLLOW hits a symlink.
+        if exc.errno not in (errno.ENOTDIR, errno.ELOOP):
+            raise
+        LOGGER.debug("Deleting file '%s'.", name)
+        try:
+            os.unlink(name, dir_fd=dir_fd)
+        except FileNotFoundError:
+            return False
+        return True
+
+    try:
+        _clear_directory_fd(child_fd)
+    finally:
+        os.close(child_fd)
+    LOGGER.debug("Removing directory '%s'.", name)
+    os.rmdir(name, dir_fd=dir_fd)
+    return True
+
+
+def _clear_directory_fd(top_fd: int) -> None:
+    """Delete everything inside the directory open as *top_fd*.
+
+    Walks iteratively so deep trees do not hit the recursion limit. Each stack
+    entry holds an open directory descriptor, its name in the parent and the
+    entries still to visit.
+    """
+
+    stack = [(top_fd, "", _scandir_fd(top_fd))]
+    try:
+        while stack:
+            dir_fd, dir_name, entries = stack[-1]
+            for entry in entries:
+                if not _entry_is_dir(entry) and _unlink_fd(entry.name, dir_fd):
+                    continue
+
+                try:
+                    child_fd = os.open(entry.name, _O_DIRECTORY_NOFOLLOW, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    continue
+                except OSError as exc:
+                    if exc.errno not in (errno.ENOTDIR, errno.ELOOP):
+                        raise
+                    # Swapped for a file or symlink since the scan; never follow it.
+                    os.unlink(entry.name, dir_fd=dir_fd)
+                    continue
+                try:
+                    child_entries = _scandir_fd(child_fd)
+                except BaseException:
+                    os.close(child_fd)
+                    raise
+                stack.append((child_fd, entry.name, child_entries))
+                break
+            else:
+                stack.pop()
+                if stack:
+                    os.close(dir_fd)
+                    os.rmdir(dir_name, dir_fd=stack[-1][0])
+    finally:
+        for dir_fd, _, _ in stack[1:]:
+            os.close(dir_fd)
+
+
+def _scandir_fd(dir_fd: int) -> Iterator[os.DirEntry]:
+    with os.scandir(dir_fd) as entries:
+        return iter(list(entries))
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+
+
+def _unlink_fd(name: str, dir_fd: int) -> bool:
+    """Unlink *name*; return ``False`` if it has become a directory since it was scanned."""
+
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        # EISDIR on Linux; some platforms report EPERM for directories.
+        if exc.errno not in (errno.EISDIR, errno.EPERM):
+            raise
+        return False
+    return True
+
+
 _SHERB_NOCONFIRMATION = 0x00000001
 _SHERB_NOPROGRESSUI = 0x00000002
 _SHERB_NOSOUND = 0x00000004
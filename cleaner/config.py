@@ -5,8 +5,20 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .schedule import CronSchedule, TimeWindow
+
+
+def _non_negative_seconds(data: Dict[str, Any], name: str, default: float) -> float:
+    value = data.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"The '{name}' option must be a number of seconds.")
+    if value < 0:
+        raise ValueError(f"The '{name}' option must not be negative.")
+    return float(value)
 
 
 @dataclass
@@ -20,6 +32,10 @@ class CleanerConfig:
     delete_folder_itself: bool = False
     recreate_folder: bool = True
     suppress_notifications: bool = False
+    schedule: Optional[str] = None
+    schedule_windows: Tuple[str, ...] = ()
+    schedule_jitter_seconds: float = 0.0
+    schedule_small_run_seconds: float = 60.0
 
     @classmethod
     def from_mapping(cls, data: Dict[str, Any]) -> "CleanerConfig":
@@ -28,6 +44,8 @@ class CleanerConfig:
         folder_value = data.get("folder")
         if not folder_value:
             raise ValueError("Configuration is missing the 'folder' option.")
+        if not isinstance(folder_value, str):
+            raise ValueError("The 'folder' option must be a path string.")
 
         folder_path = Path(folder_value).expanduser()
         if not folder_path.is_absolute():
@@ -40,6 +58,31 @@ class CleanerConfig:
         recreate_folder = bool(data.get("recreate_folder", cls.recreate_folder))
         suppress_notifications = bool(data.get("suppress_notifications", cls.suppress_notifications))
 
+        schedule = data.get("schedule") or None
+        if schedule is not None:
+            if not isinstance(schedule, str):
+                raise ValueError("The 'schedule' option must be a cron expression string.")
+            # Also reject expressions that parse but never fire, e.g. "0 0 30 2 *".
+            CronSchedule.parse(schedule).next_after(datetime.now())
+
+        schedule_windows = data.get("schedule_windows") or []
+        if not isinstance(schedule_windows, list) or not all(
+            isinstance(window, str) for window in schedule_windows
+        ):
+            raise ValueError(
+                "The 'schedule_windows' option must be a list of 'HH:MM-HH:MM' strings."
+            )
+        schedule_windows = tuple(schedule_windows)
+        for window in schedule_windows:
+            TimeWindow.parse(window)
+
+        schedule_jitter_seconds = _non_negative_seconds(
+            data, "schedule_jitter_seconds", cls.schedule_jitter_seconds
+        )
+        schedule_small_run_seconds = _non_negative_seconds(
+            data, "schedule_small_run_seconds", cls.schedule_small_run_seconds
+        )
+
         return cls(
             folder=folder_path,
             hotkey=hotkey,
@@ -48,6 +91,10 @@ class CleanerConfig:
             delete_folder_itself=delete_folder_itself,
             recreate_folder=recreate_folder,
             suppress_notifications=suppress_notifications,
+            schedule=schedule,
+            schedule_windows=schedule_windows,
+            schedule_jitter_seconds=schedule_jitter_seconds,
+            schedule_small_run_seconds=schedule_small_run_seconds,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -61,6 +108,10 @@ class CleanerConfig:
             "delete_folder_itself": self.delete_folder_itself,
             "recreate_folder": self.recreate_folder,
             "suppress_notifications": self.suppress_notifications,
+            "schedule": self.schedule,
+            "schedule_windows": list(self.schedule_windows),
+            "schedule_jitter_seconds": self.schedule_jitter_seconds,
+            "schedule_small_run_seconds": self.schedule_small_run_seconds,
         }
 
 
@@ -79,7 +130,63 @@ def load_config(path: Optional[Path]) -> CleanerConfig:
             payload: Dict[str, Any] = json.load(handle)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Configuration file '{path}' is not valid JSON: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"Configuration file '{path}' must contain a JSON object.")
 
     config = CleanerConfig.from_mapping(payload)
     logging.debug("Loaded configuration: %s", config)
     return config
+
+
+class ConfigWatcher:
+    """Reload a configuration file when its modification time or size changes.
+
+    ``poll`` only stats the file; it is reparsed and validated when the stat
+    signature differs from the last one seen. *transform* is applied to every
+    reloaded configuration, for example to keep command line overrides.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: CleanerConfig,
+        transform: Optional[Callable[[CleanerConfig], CleanerConfig]] = None,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.config = config
+        self._transform = transform
+        self._signature = self._stat_signature()
+
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = self.path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def poll(self) -> Optional[CleanerConfig]:
+        """Return the new configuration if the file changed and is valid, else ``None``."""
+
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return None
+        self._signature = signature
+        if signature is None:
+            logging.warning(
+                "Configuration file '%s' disappeared; keeping current settings.", self.path
+            )
+            return None
+
+        try:
+            config = load_config(self.path)
+            if self._transform is not None:
+                config = self._transform(config)
+        except Exception as exc:
+            # Never let a bad edit stop future reloads; keep the current settings.
+            logging.error("Ignoring invalid configuration change: %s", exc)
+            return None
+
+        if config == self.config:
+            return None
+        self.config = config
+        return config
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import logging
+import random
 import threading
-from typing import Callable
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, Sequence
 
 import keyboard
 
 from .cleanup import delete_folder_contents, empty_recycle_bin
-from .config import CleanerConfig
+from .config import CleanerConfig, ConfigWatcher
+from .schedule import CronSchedule, RunDurationEstimator, TimeWindow, plan_run
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +28,7 @@ class _CleanupTask:
 
     def trigger(self) -> None:
         if not self._lock.acquire(blocking=False):
-            LOGGER.warning("Cleanup already in progress; ignoring additional hotkey press.")
+            LOGGER.warning("Cleanup already in progress; ignoring additional trigger.")
             return
 
         thread = threading.Thread(target=self._run, name="cleaner-task", daemon=True)
@@ -38,14 +43,116 @@ class _CleanupTask:
             self._lock.release()
 
 
-def start_hotkey_listener(config: CleanerConfig) -> None:
-    """Start listening for the configured hotkey and execute the cleanup."""
+# Re-check the wall clock at least this often while waiting for a scheduled
+# run so that sleep/resume and clock changes do not delay it indefinitely.
+_SCHEDULE_POLL_SECONDS = 60.0
 
-    LOGGER.info("Hotkey '%s' armed. Target folder: %s", config.hotkey, config.folder)
-    LOGGER.info("Press CTRL+C in this window to stop the listener.")
 
-    def action() -> None:
-        LOGGER.info("Hotkey pressed; starting cleanup.")
+class _ScheduledTrigger:
+    """Trigger a :class:`_CleanupTask` according to a cron schedule."""
+
+    def __init__(
+        self,
+        task: _CleanupTask,
+        cron: CronSchedule,
+        windows: Sequence[TimeWindow],
+        estimator: RunDurationEstimator,
+        *,
+        jitter_seconds: float,
+        small_run_seconds: float,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._task = task
+        self._cron = cron
+        self._windows = tuple(windows)
+        self._estimator = estimator
+        self._jitter_seconds = jitter_seconds
+        self._small_run_seconds = small_run_seconds
+        self._rng = rng or random.Random()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def next_run(self, now: datetime) -> datetime:
+        """Return when the next scheduled cleanup after *now* should start."""
+
+        return plan_run(
+            self._cron.next_after(now),
+            self._windows,
+            estimate=self._estimator.estimate(),
+            small_run_seconds=self._small_run_seconds,
+            jitter_seconds=self._jitter_seconds,
+            rng=self._rng,
+        )
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="cleaner-schedule", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                run_at = self.next_run(datetime.now())
+            except Exception:
+                LOGGER.exception("Unable to plan the next scheduled cleanup; schedule disabled.")
+                return
+            LOGGER.info("Next scheduled cleanup at %s.", run_at.isoformat(timespec="seconds"))
+            while not self._stop.is_set():
+                remaining = (run_at - datetime.now()).total_seconds()
+                if remaining <= 0:
+                    break
+                self._stop.wait(min(remaining, _SCHEDULE_POLL_SECONDS))
+            if self._stop.is_set():
+                return
+            LOGGER.info("Scheduled cleanup due; starting cleanup.")
+            self._task.trigger()
+
+
+# How often the listener checks config.json for changes.
+_CONFIG_POLL_SECONDS = 2.0
+
+_SCHEDULE_FIELDS = (
+    "schedule",
+    "schedule_windows",
+    "schedule_jitter_seconds",
+    "schedule_small_run_seconds",
+)
+
+
+class _Listener:
+    """Own the hotkey, schedule and cleanup task for the current configuration.
+
+    The configuration can be swapped while the listener runs. A cleanup that
+    is already running finishes with the settings it started with; the hotkey
+    and schedule are only rebuilt when the settings they depend on change.
+    """
+
+    def __init__(self, config: CleanerConfig) -> None:
+        self.config = config
+        self._task = _CleanupTask(self._action)
+        self._estimator = RunDurationEstimator()
+        self._hotkey_handle: Optional[object] = None
+        self._scheduler: Optional[_ScheduledTrigger] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        self._hotkey_handle = keyboard.add_hotkey(
+            self.config.hotkey, self._task.trigger, suppress=False
+        )
+        self._scheduler = self._build_scheduler(self.config)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.stop()
+
+    def _action(self) -> None:
+        config = self.config
+        estimator = self._estimator
+        LOGGER.info("Starting cleanup.")
+        started = time.perf_counter()
         delete_folder_contents(
             config.folder,
             send_to_recycle_bin=config.send_to_recycle_bin,
@@ -57,12 +164,94 @@ def start_hotkey_listener(config: CleanerConfig) -> None:
                 empty_recycle_bin(silent=config.suppress_notifications)
             except OSError as exc:
                 LOGGER.error("Failed to empty the Recycle Bin: %s", exc)
+        estimator.record(time.perf_counter() - started)
         LOGGER.info("Cleanup completed.")
 
-    task = _CleanupTask(action)
-    keyboard.add_hotkey(config.hotkey, task.trigger, suppress=False)
+    def _build_scheduler(self, config: CleanerConfig) -> Optional[_ScheduledTrigger]:
+        if not config.schedule:
+            return None
+        scheduler = _ScheduledTrigger(
+            self._task,
+            CronSchedule.parse(config.schedule),
+            [TimeWindow.parse(window) for window in config.schedule_windows],
+            self._estimator,
+            jitter_seconds=config.schedule_jitter_seconds,
+            small_run_seconds=config.schedule_small_run_seconds,
+        )
+        scheduler.start()
+        return scheduler
+
+    def apply(self, config: CleanerConfig) -> None:
+        """Switch to *config*, re-registering only what depends on changed settings."""
+
+        old = self.config
+        if config.hotkey != old.hotkey:
+            try:
+                handle = keyboard.add_hotkey(config.hotkey, self._task.trigger, suppress=False)
+            except ValueError as exc:
+                LOGGER.error("Ignoring configuration change; invalid hotkey: %s", exc)
+                return
+            keyboard.remove_hotkey(self._hotkey_handle)
+            self._hotkey_handle = handle
+            LOGGER.info("Hotkey changed to '%s'.", config.hotkey)
+
+        folder_changed = config.folder != old.folder
+        if folder_changed:
+            # Timings of the previous folder say nothing about the new one.
+            self._estimator = RunDurationEstimator()
+            LOGGER.info("Target folder changed to %s.", config.folder)
+
+        schedule_changed = any(
+            getattr(config, name) != getattr(old, name) for name in _SCHEDULE_FIELDS
+        )
+        self.config = config
+        if schedule_changed or (folder_changed and self._scheduler is not None):
+            # Build the replacement first so a failure leaves the old one running.
+            previous = self._scheduler
+            self._scheduler = self._build_scheduler(config)
+            if previous is not None:
+                previous.stop()
+
+        LOGGER.info("Configuration reloaded.")
+
+    def watch(self, watcher: ConfigWatcher, interval: float = _CONFIG_POLL_SECONDS) -> None:
+        """Poll *watcher* in the background and apply configuration changes."""
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    config = watcher.poll()
+                    if config is not None:
+                        self.apply(config)
+                except Exception:  # pragma: no cover - best effort logging
+                    LOGGER.exception("Failed to apply configuration change.")
+
+        threading.Thread(target=run, name="cleaner-config", daemon=True).start()
+
+
+def start_hotkey_listener(
+    config: CleanerConfig,
+    config_path: Optional[Path] = None,
+    transform: Optional[Callable[[CleanerConfig], CleanerConfig]] = None,
+) -> None:
+    """Start listening for the configured hotkey and execute the cleanup.
+
+    When *config_path* is given, the file is watched and changes are applied
+    without restarting the listener. *transform* is applied to every reloaded
+    configuration.
+    """
+
+    LOGGER.info("Hotkey '%s' armed. Target folder: %s", config.hotkey, config.folder)
+    LOGGER.info("Press CTRL+C in this window to stop the listener.")
+
+    listener = _Listener(config)
+    listener.start()
+    if config_path is not None:
+        listener.watch(ConfigWatcher(config_path, config, transform))
 
     try:
         keyboard.wait()
     except KeyboardInterrupt:
         LOGGER.info("Listener stopped by user.")
+    finally:
+        listener.stop()
@@ -0,0 +1,240 @@
+"""Schedule helpers for running cleanups without a hotkey press."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import FrozenSet, Optional, Sequence
+
+_CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+
+# Give up looking for a matching minute after this long; expressions such as
+# "0 0 31 2 *" never fire.
+_CRON_SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+def _parse_cron_field(text: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"Invalid step '{step_text}' in cron {name} field.")
+            step = int(step_text)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise ValueError(f"Invalid range '{part}' in cron {name} field.")
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = int(part)
+            end = high if step > 1 else start
+        else:
+            raise ValueError(f"Invalid value '{part}' in cron {name} field.")
+
+        if not (low <= start <= end <= high):
+            raise ValueError(f"Value '{part}' is out of range for cron {name} field.")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """A standard five-field cron expression evaluated in local time."""
+
+    expression: str
+    minutes: FrozenSet[int]
+    hours: FrozenSet[int]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """Parse *expression* such as ``"30 2 * * 1-5"``."""
+
+        fields = expression.split()
+        if len(fields) != len(_CRON_FIELDS):
+            raise ValueError(
+                f"Cron expression '{expression}' must have {len(_CRON_FIELDS)} fields."
+            )
+
+        minutes, hours, days, months, weekdays = (
+            _parse_cron_field(text, name, low, high)
+            for text, (name, low, high) in zip(fields, _CRON_FIELDS)
+        )
+        # Both 0 and 7 mean Sunday.
+        if 7 in weekdays:
+            weekdays = (weekdays - {7}) | {0}
+
+        return cls(
+            expression=expression,
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=weekdays,
+            # Like Vixie cron, any field starting with "*" (including "*/2")
+            # counts as unrestricted when combining day of month and weekday.
+            days_restricted=not fields[2].startswith("*"),
+            weekdays_restricted=not fields[4].startswith("*"),
+        )
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # Python counts Monday as 0; cron counts Sunday as 0.
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute strictly after *moment*."""
+
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + _CRON_SEARCH_LIMIT
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(
+                    year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression '{self.expression}' never matches.")
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """A daily time-of-day window such as ``01:00-05:00``; may wrap past midnight."""
+
+    start: time
+    end: time
+
+    @classmethod
+    def parse(cls, text: str) -> "TimeWindow":
+        """Parse a window written as ``HH:MM-HH:MM``."""
+
+        try:
+            start_text, end_text = text.split("-")
+            start = time.fromisoformat(start_text.strip())
+            end = time.fromisoformat(end_text.strip())
+        except ValueError as exc:
+            raise ValueError(f"Invalid time window '{text}'; expected HH:MM-HH:MM.") from exc
+        if start == end:
+            raise ValueError(f"Time window '{text}' is empty.")
+        return cls(start=start, end=end)
+
+    @property
+    def length(self) -> timedelta:
+        start = datetime.combine(date.min, self.start)
+        end = datetime.combine(date.min, self.end)
+        if end <= start:
+            end += timedelta(days=1)
+        return end - start
+
+    def _opened_at(self, moment: datetime) -> datetime:
+        """Return the most recent opening of the window at or before *moment*."""
+
+        opened = datetime.combine(moment.date(), self.start)
+        if opened > moment:
+            opened -= timedelta(days=1)
+        return opened
+
+    def contains(self, moment: datetime) -> bool:
+        return moment < self._opened_at(moment) + self.length
+
+    def closes_at(self, moment: datetime) -> datetime:
+        """Return when the window that contains *moment* closes."""
+
+        return self._opened_at(moment) + self.length
+
+    def next_start(self, moment: datetime) -> datetime:
+        """Return the first opening of the window at or after *moment*."""
+
+        opened = self._opened_at(moment)
+        if opened == moment:
+            return opened
+        return opened + timedelta(days=1)
+
+
+class RunDurationEstimator:
+    """Estimate how long the next cleanup will take from previous runs."""
+
+    def __init__(self, smoothing: float = 0.5) -> None:
+        self._smoothing = smoothing
+        self._estimate: Optional[float] = None
+
+    def record(self, seconds: float) -> None:
+        if self._estimate is None:
+            self._estimate = seconds
+        else:
+            self._estimate += self._smoothing * (seconds - self._estimate)
+
+    def estimate(self) -> Optional[float]:
+        """Return the expected duration in seconds, or ``None`` before the first run."""
+
+        return self._estimate
+
+
+def plan_run(
+    due: datetime,
+    windows: Sequence[TimeWindow],
+    *,
+    estimate: Optional[float],
+    small_run_seconds: float,
+    jitter_seconds: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> datetime:
+    """Decide when a cleanup that is *due* should actually start.
+
+    Runs expected to take at most *small_run_seconds* start right away. Larger
+    runs, and runs with no timing history yet, only start inside one of the
+    *windows* with enough time left to finish; otherwise they are deferred to
+    the next window opening that is long enough. Up to *jitter_seconds* of
+    random delay is added, limited so a windowed run still has room to finish.
+    """
+
+    rng = rng or random
+    if not windows or (estimate is not None and estimate <= small_run_seconds):
+        return _add_jitter(due, jitter_seconds, rng)
+
+    needed = timedelta(seconds=estimate or 0.0)
+    for window in windows:
+        if window.contains(due) and due + needed <= window.closes_at(due):
+            room = window.closes_at(due) - due - needed
+            return _add_jitter(due, min(jitter_seconds, room.total_seconds()), rng)
+
+    openings = sorted(
+        ((window.next_start(due), window) for window in windows), key=lambda item: item[0]
+    )
+    fitting = [(start, window) for start, window in openings if window.length >= needed]
+    # If no window is long enough, start as early as possible anyway.
+    start, window = (fitting or openings)[0]
+    room = window.length - needed
+    return _add_jitter(start, min(jitter_seconds, room.total_seconds()), rng)
+
+
+def _add_jitter(moment: datetime, jitter_seconds: float, rng: random.Random) -> datetime:
+    if jitter_seconds <= 0:
+        return moment
+    return moment + timedelta(seconds=rng.uniform(0.0, jitter_seconds))
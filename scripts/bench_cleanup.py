@@ -0,0 +1,163 @@
+"""Compare the fd-relative and path-based permanent deletion strategies.
+
+Builds synthetic trees in a scratch directory and times
+``cleaner.cleanup.delete_folder_contents`` with the fd-relative fast path
+enabled and disabled. Results are written as JSON, one entry per tree shape.
+
+The path-based strategy hands each top-level directory to ``shutil.rmtree``,
+which on Linux already walks fd-relative below that point. Deep trees with few
+top-level entries therefore come out roughly at parity; the fast path wins when
+the target folder holds many entries, because each one no longer costs a full
+path resolution.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from cleaner import cleanup  # noqa: E402
+
+
+def build_tree(root: Path, *, depth: int, branches: int, files: int) -> int:
+    """Create a tree under *root* and return the number of entries created."""
+
+    created = 0
+    level = [root]
+    for _ in range(depth):
+        next_level = []
+        for directory in level:
+            for index in range(files):
+                (directory / f"f{index}.bin").write_bytes(b"x")
+                created += 1
+            for index in range(branches):
+                child = directory / f"d{index}"
+                child.mkdir()
+                next_level.append(child)
+                created += 1
+        level = next_level
+    return created
+
+
+def _time_strategy(root: Path, shape: Dict[str, int], use_fd: bool, repeats: int) -> List[float]:
+    original = cleanup._USE_FD_FUNCTIONS
+    cleanup._USE_FD_FUNCTIONS = use_fd
+    durations = []
+    try:
+        for _ in range(repeats):
+            build_tree(root, **shape)
+            started = time.perf_counter()
+            cleanup.delete_folder_contents(
+                root,
+                send_to_recycle_bin=False,
+                delete_folder_itself=False,
+                recreate_folder=False,
+            )
+            durations.append(time.perf_counter() - started)
+            if any(root.iterdir()):
+                raise RuntimeError(f"Deletion left entries behind in '{root}'.")
+    finally:
+        cleanup._USE_FD_FUNCTIONS = original
+    return durations
+
+
+def _summary(durations: Sequence[float]) -> Dict[str, float]:
+    return {
+        "min_ms": min(durations) * 1e3,
+        "median_ms": statistics.median(durations) * 1e3,
+        "max_ms": max(durations) * 1e3,
+    }
+
+
+def run_shape(scratch: Path, name: str, shape: Dict[str, int], repeats: int) -> Dict[str, Any]:
+    root = scratch / name
+    root.mkdir()
+    entries = build_tree(root, **shape)
+    cleanup.delete_folder_contents(
+        root, send_to_recycle_bin=False, delete_folder_itself=False, recreate_folder=False
+    )
+
+    # Two passes in opposite order so neither strategy always runs on a warmer cache.
+    times: Dict[bool, List[float]] = {False: [], True: []}
+    for order in ((False, True), (True, False)):
+        for use_fd in order:
+            times[use_fd] += _time_strategy(root, shape, use_fd=use_fd, repeats=repeats)
+    path_times, fd_times = times[False], times[True]
+
+    return {
+        "shape": name,
+        **shape,
+        "entries": entries,
+        "path_based": _summary(path_times),
+        "fd_relative": _summary(fd_times),
+        "speedup": statistics.median(path_times) / statistics.median(fd_times),
+    }
+
+
+_SHAPES: Tuple[Tuple[str, Dict[str, int]], ...] = (
+    # Few top-level entries: expected to be close to parity.
+    ("deep-chain", {"depth": 400, "branches": 1, "files": 4}),
+    ("deep-bushy", {"depth": 6, "branches": 4, "files": 4}),
+    # Many top-level entries: where the fd-relative path is expected to win.
+    ("wide-flat", {"depth": 1, "branches": 500, "files": 2000}),
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs per strategy and pass; each strategy is timed in two passes (default: 3).",
+    )
+    parser.add_argument(
+        "--scratch",
+        type=Path,
+        help="Directory to build trees in (default: a new temporary directory).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the JSON results to this file instead of stdout.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    if not cleanup._USE_FD_FUNCTIONS:
+        raise SystemExit("The fd-relative deletion path is not supported on this platform.")
+
+    with tempfile.TemporaryDirectory(dir=args.scratch) as scratch:
+        results = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "filesystem_root": os.fspath(scratch),
+            "shapes": [
+                run_shape(Path(scratch), name, shape, args.repeats) for name, shape in _SHAPES
+            ],
+        }
+
+    payload = json.dumps(results, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
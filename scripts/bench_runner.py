@@ -0,0 +1,279 @@
+"""Benchmark trigger latency and contention behaviour of the hotkey runner.
+
+The real ``keyboard`` module is replaced by a stub so the benchmark runs
+headless on Linux. The stub captures the callback registered by
+``cleaner.runner.start_hotkey_listener`` and, instead of blocking in
+``keyboard.wait()``, fires synthetic triggers at a fixed rate. The cleanup
+itself is replaced by a timed no-op so only the runner overhead is measured.
+
+Results are written as JSON, one entry per trigger rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+class _Scenario:
+    """State shared between the keyboard stub and the fake cleanup action."""
+
+    def __init__(self, rate: float, duration: float, work_seconds: float) -> None:
+        self.rate = rate
+        self.duration = duration
+        self.work_seconds = work_seconds
+        self.callback: Optional[Callable[[], None]] = None
+        self.lock: Optional[_RecordingLock] = None
+        self.accepted_at: List[float] = []
+        self.started_at: List[float] = []
+        self.trigger_call_seconds: List[float] = []
+        self.triggers = 0
+        self.dropped = 0
+        self.idle = threading.Event()
+        self.idle.set()
+
+
+_SCENARIO: Optional[_Scenario] = None
+
+
+class _RecordingLock:
+    """Wrap the task's lock and remember whether each thread's last acquire succeeded.
+
+    ``_CleanupTask.trigger`` starts a cleanup only when its non-blocking
+    acquire succeeds, so a failed acquire is exactly a dropped trigger.
+    """
+
+    def __init__(self, lock: Any) -> None:
+        self._lock = lock
+        self._results = threading.local()
+
+    def acquire(self, *args: Any, **kwargs: Any) -> bool:
+        acquired = self._lock.acquire(*args, **kwargs)
+        self._results.acquired = acquired
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def last_acquire_succeeded(self) -> Optional[bool]:
+        acquired = getattr(self._results, "acquired", None)
+        self._results.acquired = None
+        return acquired
+
+
+def _stub_add_hotkey(hotkey: str, callback: Callable[[], None], **kwargs: Any) -> None:
+    assert _SCENARIO is not None
+    task = getattr(callback, "__self__", None)
+    if task is None or not hasattr(task, "_lock"):
+        raise RuntimeError("Expected the hotkey callback to be a _CleanupTask.trigger method.")
+    task._lock = _RecordingLock(task._lock)
+    _SCENARIO.callback = callback
+    _SCENARIO.lock = task._lock
+
+
+def _stub_wait(*args: Any, **kwargs: Any) -> None:
+    """Fire triggers at the scenario rate instead of waiting for key presses."""
+
+    scenario = _SCENARIO
+    assert scenario is not None and scenario.callback is not None
+    assert scenario.lock is not None
+
+    interval = 1.0 / scenario.rate
+    start = time.perf_counter()
+    deadline = start + scenario.duration
+    next_fire = start
+    while next_fire < deadline:
+        delay = next_fire - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        fired_at = time.perf_counter()
+        scenario.callback()
+        returned_at = time.perf_counter()
+
+        scenario.triggers += 1
+        scenario.trigger_call_seconds.append(returned_at - fired_at)
+        acquired = scenario.lock.last_acquire_succeeded()
+        if acquired is None:
+            raise RuntimeError("Trigger did not try to acquire the cleanup lock.")
+        if acquired:
+            scenario.accepted_at.append(fired_at)
+        else:
+            scenario.dropped += 1
+        next_fire += interval
+
+
+def _install_keyboard_stub() -> None:
+    stub = ModuleType("keyboard")
+    stub.add_hotkey = _stub_add_hotkey  # type: ignore[attr-defined]
+    stub.wait = _stub_wait  # type: ignore[attr-defined]
+    sys.modules["keyboard"] = stub
+
+
+def _fake_delete_folder_contents(folder: Path, **kwargs: Any) -> None:
+    scenario = _SCENARIO
+    assert scenario is not None
+    scenario.started_at.append(time.perf_counter())
+    scenario.idle.clear()
+    if scenario.work_seconds > 0:
+        time.sleep(scenario.work_seconds)
+    scenario.idle.set()
+
+
+def _percentiles(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Return latency percentiles in microseconds."""
+
+    if not samples:
+        return {"count": 0, "min": None, "p50": None, "p90": None, "p99": None, "max": None}
+
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index] * 1e6
+
+    return {
+        "count": len(ordered),
+        "min": ordered[0] * 1e6,
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": ordered[-1] * 1e6,
+    }
+
+
+def measure_thread_overhead(samples: int) -> Dict[str, Optional[float]]:
+    """Time creating, starting and joining a daemon thread that does nothing."""
+
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        thread = threading.Thread(target=lambda: None, daemon=True)
+        thread.start()
+        thread.join()
+        durations.append(time.perf_counter() - started)
+    return _percentiles(durations)
+
+
+def run_scenario(rate: float, duration: float, work_seconds: float) -> Dict[str, Any]:
+    """Drive ``start_hotkey_listener`` with synthetic triggers at *rate* per second."""
+
+    global _SCENARIO
+
+    from cleaner import runner
+    from cleaner.config import CleanerConfig
+
+    scenario = _Scenario(rate, duration, work_seconds)
+    _SCENARIO = scenario
+    config = CleanerConfig(folder=REPO_ROOT, hotkey="bench", empty_recycle_bin=False)
+
+    original_delete = runner.delete_folder_contents
+    runner.delete_folder_contents = _fake_delete_folder_contents
+    try:
+        runner.start_hotkey_listener(config)
+        # Let the last accepted cleanup finish so its start time is recorded.
+        deadline = time.perf_counter() + work_seconds + 1.0
+        while len(scenario.started_at) < len(scenario.accepted_at):
+            if time.perf_counter() > deadline:
+                break
+            time.sleep(0.001)
+        scenario.idle.wait(timeout=work_seconds + 1.0)
+    finally:
+        runner.delete_folder_contents = original_delete
+        _SCENARIO = None
+
+    # Cleanups are serialised, so the n-th start belongs to the n-th accepted trigger.
+    latencies = [
+        started - accepted
+        for accepted, started in zip(scenario.accepted_at, scenario.started_at)
+    ]
+    accepted = len(scenario.accepted_at)
+    return {
+        "rate_hz": rate,
+        "duration_s": duration,
+        "work_ms": work_seconds * 1e3,
+        "triggers": scenario.triggers,
+        "accepted": accepted,
+        "started": len(scenario.started_at),
+        "dropped": scenario.dropped,
+        "drop_ratio": scenario.dropped / scenario.triggers if scenario.triggers else 0.0,
+        "trigger_to_start_us": _percentiles(latencies),
+        "trigger_call_us": _percentiles(scenario.trigger_call_seconds),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        default=[1.0, 10.0, 100.0, 1000.0],
+        help="Trigger rates to test, in triggers per second.",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=2.0,
+        help="Seconds to fire triggers for at each rate (default: 2).",
+    )
+    parser.add_argument(
+        "--work-ms",
+        type=float,
+        default=5.0,
+        help="Simulated cleanup duration in milliseconds (default: 5).",
+    )
+    parser.add_argument(
+        "--thread-samples",
+        type=int,
+        default=500,
+        help="Number of bare threads to time for the baseline (default: 500).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the JSON results to this file instead of stdout.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    _install_keyboard_stub()
+    # Keep the benchmark output clean of per-trigger warnings.
+    logging.getLogger("cleaner.runner").setLevel(logging.ERROR)
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "thread_start_join_us": measure_thread_overhead(args.thread_samples),
+        "scenarios": [
+            run_scenario(rate, args.duration, args.work_ms / 1e3) for rate in args.rates
+        ],
+    }
+
+    payload = json.dumps(results, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -40,6 +41,110 @@ def test_delete_folder_itself_and_recreate(tmp_path):
     assert not any(tmp_path.iterdir())
 
 
+def test_delete_folder_contents_path_fallback(monkeypatch, tmp_path):
+    _create_fixture_directory(tmp_path)
+    monkeypatch.setattr(cleanup, "_USE_FD_FUNCTIONS", False)
+
+    cleanup.delete_folder_contents(
+        tmp_path,
+        send_to_recycle_bin=False,
+        delete_folder_itself=False,
+        recreate_folder=False,
+    )
+
+    assert tmp_path.exists()
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.skipif(not cleanup._USE_FD_FUNCTIONS, reason="requires dir_fd support")
+def test_delete_folder_contents_does_not_follow_symlinks(tmp_path):
+    target = tmp_path / "target"
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+    target.mkdir()
+    _create_fixture_directory(target)
+    (target / "link").symlink_to(outside, target_is_directory=True)
+    (target / "sub" / "link").symlink_to(outside / "keep.txt")
+
+    cleanup.delete_folder_contents(
+        target,
+        send_to_recycle_bin=False,
+        delete_folder_itself=False,
+        recreate_folder=False,
+    )
+
+    assert not any(target.iterdir())
+    assert (outside / "keep.txt").read_text() == "keep"
+
+
+@pytest.mark.skipif(not cleanup._USE_FD_FUNCTIONS, reason="requires dir_fd support")
+def test_delete_folder_contents_handles_deep_trees(tmp_path):
+    # Deeper than the recursion limit and longer than PATH_MAX as a full path.
+    depth = 1500
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        for _ in range(depth):
+            os.mkdir("d", dir_fd=dir_fd)
+            child_fd = os.open("d", os.O_RDONLY, dir_fd=dir_fd)
+            os.close(dir_fd)
+            dir_fd = child_fd
+        os.close(os.open("leaf.txt", os.O_CREAT | os.O_WRONLY, dir_fd=dir_fd))
+    finally:
+        os.close(dir_fd)
+
+    cleanup.delete_folder_contents(
+        tmp_path,
+        send_to_recycle_bin=False,
+        delete_folder_itself=False,
+        recreate_folder=False,
+    )
+
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.skipif(not cleanup._USE_FD_FUNCTIONS, reason="requires dir_fd support")
+def test_delete_folder_contents_closes_fds_when_scan_fails(monkeypatch, tmp_path):
+    _create_fixture_directory(tmp_path)
+    opened = []
+    closed = []
+    real_open = os.open
+    real_close = os.close
+
+    def tracking_open(*args, **kwargs):
+        fd = real_open(*args, **kwargs)
+        opened.append(fd)
+        return fd
+
+    def tracking_close(fd):
+        closed.append(fd)
+        real_close(fd)
+
+    real_scandir = cleanup._scandir_fd
+    scans = []
+
+    def failing_scandir(dir_fd):
+        scans.append(dir_fd)
+        if len(scans) > 1:
+            raise PermissionError("denied")
+        return real_scandir(dir_fd)
+
+    monkeypatch.setattr(cleanup.os, "open", tracking_open)
+    monkeypatch.setattr(cleanup.os, "close", tracking_close)
+    monkeypatch.setattr(cleanup, "_scandir_fd", failing_scandir)
+
+    with pytest.raises(PermissionError):
+        cleanup.delete_folder_contents(
+            tmp_path,
+            send_to_recycle_bin=False,
+            delete_folder_itself=False,
+            recreate_folder=False,
+        )
+
+    assert len(opened) == 2
+    assert sorted(closed) == sorted(opened)
+
+
 def test_delete_folder_handles_missing(tmp_path):
     target = tmp_path / "missing"
 
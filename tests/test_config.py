@@ -1,9 +1,11 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from cleaner.config import CleanerConfig, load_config
+import cleaner.config as config_module
+from cleaner.config import CleanerConfig, ConfigWatcher, load_config
 
 
 def test_from_mapping_resolves_relative_folder(tmp_path, monkeypatch):
@@ -85,3 +87,139 @@ def test_load_config_invalid_json(tmp_path):
 
     with pytest.raises(ValueError):
         load_config(config_path)
+
+
+def test_from_mapping_reads_schedule(tmp_path):
+    cfg = CleanerConfig.from_mapping(
+        {
+            "folder": str(tmp_path),
+            "schedule": "0 2 * * *",
+            "schedule_windows": ["01:00-05:00"],
+            "schedule_jitter_seconds": 300,
+            "schedule_small_run_seconds": 30,
+        }
+    )
+
+    assert cfg.schedule == "0 2 * * *"
+    assert cfg.schedule_windows == ("01:00-05:00",)
+    assert cfg.schedule_jitter_seconds == 300.0
+    assert cfg.schedule_small_run_seconds == 30.0
+    assert CleanerConfig.from_mapping(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"schedule": "not a cron"},
+        {"schedule_windows": ["later"]},
+        {"schedule_jitter_seconds": -1},
+        {"schedule": 5},
+        {"schedule_windows": "01:00-05:00"},
+        {"schedule_windows": [1]},
+        {"schedule_jitter_seconds": None},
+        {"schedule_jitter_seconds": "60"},
+        {"schedule_small_run_seconds": -1},
+        {"schedule": "0 0 30 2 *"},
+    ],
+)
+def test_from_mapping_rejects_invalid_schedule(tmp_path, options):
+    with pytest.raises(ValueError):
+        CleanerConfig.from_mapping({"folder": str(tmp_path), **options})
+
+
+def _write_config(path: Path, payload, mtime_ns: int) -> None:
+    path.write_text(json.dumps(payload))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_config_watcher_reloads_only_on_change(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"folder": str(tmp_path), "hotkey": "alt+a"}, 1_000_000_000)
+    watcher = ConfigWatcher(config_path, load_config(config_path))
+
+    loads = []
+    original_load = config_module.load_config
+    monkeypatch.setattr(
+        config_module, "load_config", lambda path: loads.append(path) or original_load(path)
+    )
+
+    assert watcher.poll() is None
+    assert loads == []
+
+    _write_config(config_path, {"folder": str(tmp_path), "hotkey": "alt+b"}, 2_000_000_000)
+    reloaded = watcher.poll()
+
+    assert reloaded is not None
+    assert reloaded.hotkey == "alt+b"
+    assert watcher.config is reloaded
+    assert watcher.poll() is None
+    assert len(loads) == 1
+
+
+def test_config_watcher_keeps_previous_config_when_invalid(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"folder": str(tmp_path)}, 1_000_000_000)
+    original = load_config(config_path)
+    watcher = ConfigWatcher(config_path, original)
+
+    config_path.write_text("not-json")
+    os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+    assert watcher.poll() is None
+
+    config_path.unlink()
+    assert watcher.poll() is None
+    assert watcher.config is original
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"folder": 1},
+        ["not", "an", "object"],
+        {"folder": "target", "schedule": 5},
+        {"folder": "target", "schedule_jitter_seconds": None},
+    ],
+)
+def test_config_watcher_recovers_after_type_invalid_edit(tmp_path, payload):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"folder": str(tmp_path)}, 1_000_000_000)
+    watcher = ConfigWatcher(config_path, load_config(config_path))
+
+    _write_config(config_path, payload, 2_000_000_000)
+    assert watcher.poll() is None
+
+    _write_config(config_path, {"folder": str(tmp_path), "hotkey": "alt+z"}, 3_000_000_000)
+    reloaded = watcher.poll()
+
+    assert reloaded is not None
+    assert reloaded.hotkey == "alt+z"
+
+
+def test_load_config_rejects_wrong_types(tmp_path):
+    config_path = tmp_path / "config.json"
+    for payload in ([1, 2], {"folder": 1}):
+        config_path.write_text(json.dumps(payload))
+        with pytest.raises(ValueError):
+            load_config(config_path)
+
+
+def test_config_watcher_applies_transform(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"folder": str(tmp_path)}, 1_000_000_000)
+
+    def force_permanent(config: CleanerConfig) -> CleanerConfig:
+        config.send_to_recycle_bin = False
+        return config
+
+    watcher = ConfigWatcher(config_path, load_config(config_path), force_permanent)
+    _write_config(
+        config_path,
+        {"folder": str(tmp_path), "send_to_recycle_bin": True, "hotkey": "alt+c"},
+        2_000_000_000,
+    )
+
+    reloaded = watcher.poll()
+
+    assert reloaded is not None
+    assert reloaded.hotkey == "alt+c"
+    assert reloaded.send_to_recycle_bin is False
@@ -1,6 +1,9 @@
+import json
+import os
 import sys
 import threading
 import time
+from datetime import datetime
 from pathlib import Path
 from types import ModuleType
 
@@ -9,10 +12,13 @@ if "keyboard" not in sys.modules:
     keyboard_stub = ModuleType("keyboard")
     keyboard_stub.add_hotkey = lambda *args, **kwargs: None
     keyboard_stub.wait = lambda *args, **kwargs: None
+    keyboard_stub.remove_hotkey = lambda *args, **kwargs: None
     sys.modules["keyboard"] = keyboard_stub
 
-from cleaner.config import CleanerConfig
-from cleaner.runner import _CleanupTask
+import cleaner.runner as runner
+from cleaner.config import CleanerConfig, ConfigWatcher, load_config
+from cleaner.runner import _CleanupTask, _Listener, _ScheduledTrigger
+from cleaner.schedule import CronSchedule, RunDurationEstimator, TimeWindow
 from cleaner.__main__ import apply_overrides
 
 
@@ -45,6 +51,166 @@ def test_cleanup_task_serialises_execution():
     assert recorder.events == ["start", "end"]
 
 
+def test_scheduled_trigger_defers_using_previous_timings():
+    estimator = RunDurationEstimator()
+    scheduler = _ScheduledTrigger(
+        _CleanupTask(lambda: None),
+        CronSchedule.parse("0 * * * *"),
+        [TimeWindow.parse("01:00-05:00")],
+        estimator,
+        jitter_seconds=0.0,
+        small_run_seconds=60.0,
+    )
+    now = datetime(2024, 5, 1, 11, 30)
+
+    estimator.record(5.0)
+    assert scheduler.next_run(now) == datetime(2024, 5, 1, 12, 0)
+
+    estimator.record(7200.0)
+    estimator.record(7200.0)
+    assert scheduler.next_run(now) == datetime(2024, 5, 2, 1, 0)
+
+
+def test_scheduled_trigger_logs_and_stops_when_cron_never_matches(caplog):
+    scheduler = _ScheduledTrigger(
+        _CleanupTask(lambda: None),
+        CronSchedule.parse("0 0 30 2 *"),
+        [],
+        RunDurationEstimator(),
+        jitter_seconds=0.0,
+        small_run_seconds=60.0,
+    )
+
+    with caplog.at_level("ERROR", logger="cleaner.runner"):
+        scheduler._run()
+
+    assert "schedule disabled" in caplog.text
+
+
+class _KeyboardRecorder:
+    def __init__(self):
+        self.added = []
+        self.removed = []
+
+    def add_hotkey(self, hotkey, callback, suppress=False):
+        self.added.append(hotkey)
+        return hotkey
+
+    def remove_hotkey(self, handle):
+        self.removed.append(handle)
+
+
+def test_listener_apply_rebuilds_only_changed_parts(monkeypatch, tmp_path):
+    recorder = _KeyboardRecorder()
+    monkeypatch.setattr(runner.keyboard, "add_hotkey", recorder.add_hotkey, raising=False)
+    monkeypatch.setattr(runner.keyboard, "remove_hotkey", recorder.remove_hotkey, raising=False)
+
+    base = CleanerConfig(folder=tmp_path, hotkey="alt+a", schedule="0 2 * * *")
+    listener = _Listener(base)
+    listener.start()
+    scheduler = listener._scheduler
+    try:
+        listener.apply(
+            CleanerConfig(
+                folder=tmp_path, hotkey="alt+a", schedule="0 2 * * *", empty_recycle_bin=False
+            )
+        )
+        assert recorder.added == ["alt+a"]
+        assert listener._scheduler is scheduler
+        assert listener.config.empty_recycle_bin is False
+
+        listener.apply(CleanerConfig(folder=tmp_path, hotkey="alt+b", schedule="0 2 * * *"))
+        assert recorder.added == ["alt+a", "alt+b"]
+        assert recorder.removed == ["alt+a"]
+        assert listener._scheduler is scheduler
+
+        listener.apply(CleanerConfig(folder=tmp_path, hotkey="alt+b", schedule="0 3 * * *"))
+        assert listener._scheduler is not scheduler
+        assert scheduler._stop.is_set()
+    finally:
+        listener.stop()
+
+
+def test_listener_running_cleanup_keeps_its_config(monkeypatch, tmp_path):
+    folders = []
+    release = threading.Event()
+
+    def fake_delete(folder, **kwargs):
+        folders.append(folder)
+        release.wait(timeout=1)
+
+    monkeypatch.setattr(runner, "delete_folder_contents", fake_delete)
+    listener = _Listener(CleanerConfig(folder=tmp_path / "old", empty_recycle_bin=False))
+
+    listener._task.trigger()
+    time.sleep(0.05)
+    listener.apply(CleanerConfig(folder=tmp_path / "new", empty_recycle_bin=False))
+    release.set()
+    time.sleep(0.05)
+    listener._task.trigger()
+    time.sleep(0.05)
+
+    assert folders == [tmp_path / "old", tmp_path / "new"]
+
+
+def test_listener_watch_survives_invalid_edit(monkeypatch, tmp_path):
+    recorder = _KeyboardRecorder()
+    monkeypatch.setattr(runner.keyboard, "add_hotkey", recorder.add_hotkey, raising=False)
+    monkeypatch.setattr(runner.keyboard, "remove_hotkey", recorder.remove_hotkey, raising=False)
+
+    config_path = tmp_path / "config.json"
+
+    def save(payload, mtime_ns):
+        config_path.write_text(json.dumps(payload))
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    save({"folder": str(tmp_path), "hotkey": "alt+a"}, 1_000_000_000)
+    listener = _Listener(load_config(config_path))
+    listener.start()
+    listener.watch(ConfigWatcher(config_path, listener.config), interval=0.01)
+    try:
+        save({"folder": str(tmp_path), "schedule_jitter_seconds": None}, 2_000_000_000)
+        time.sleep(0.1)
+        save({"folder": str(tmp_path), "hotkey": "alt+z"}, 3_000_000_000)
+
+        deadline = time.monotonic() + 2
+        while listener.config.hotkey != "alt+z" and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        listener.stop()
+
+    assert listener.config.hotkey == "alt+z"
+    assert recorder.added == ["alt+a", "alt+z"]
+
+
+def test_listener_rejects_reload_with_cron_that_never_fires(monkeypatch, tmp_path):
+    recorder = _KeyboardRecorder()
+    monkeypatch.setattr(runner.keyboard, "add_hotkey", recorder.add_hotkey, raising=False)
+    monkeypatch.setattr(runner.keyboard, "remove_hotkey", recorder.remove_hotkey, raising=False)
+
+    config_path = tmp_path / "config.json"
+
+    def save(payload, mtime_ns):
+        config_path.write_text(json.dumps(payload))
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    save({"folder": str(tmp_path), "schedule": "0 2 * * *"}, 1_000_000_000)
+    listener = _Listener(load_config(config_path))
+    listener.start()
+    scheduler = listener._scheduler
+    watcher = ConfigWatcher(config_path, listener.config)
+    try:
+        save({"folder": str(tmp_path), "schedule": "0 0 30 2 *"}, 2_000_000_000)
+
+        assert watcher.poll() is None
+        assert listener._scheduler is scheduler
+        assert listener.config.schedule == "0 2 * * *"
+        assert not scheduler._stop.is_set()
+        assert scheduler._thread.is_alive()
+    finally:
+        listener.stop()
+
+
 def test_apply_overrides_updates_config(tmp_path):
     base = CleanerConfig(
         folder=tmp_path,
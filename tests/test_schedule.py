@@ -0,0 +1,150 @@
+import random
+from datetime import datetime, time
+
+import pytest
+
+from cleaner.schedule import CronSchedule, RunDurationEstimator, TimeWindow, plan_run
+
+
+def test_cron_next_after_daily():
+    cron = CronSchedule.parse("30 2 * * *")
+
+    assert cron.next_after(datetime(2024, 5, 1, 1, 0)) == datetime(2024, 5, 1, 2, 30)
+    assert cron.next_after(datetime(2024, 5, 1, 2, 30)) == datetime(2024, 5, 2, 2, 30)
+
+
+def test_cron_steps_ranges_and_lists():
+    cron = CronSchedule.parse("*/15 1-3 * * 1,3")
+
+    assert cron.minutes == {0, 15, 30, 45}
+    assert cron.hours == {1, 2, 3}
+    # 2024-05-01 is a Wednesday; the next match after 03:45 is Monday.
+    assert cron.next_after(datetime(2024, 5, 1, 3, 45)) == datetime(2024, 5, 6, 1, 0)
+
+
+def test_cron_sunday_as_seven_and_year_rollover():
+    cron = CronSchedule.parse("0 0 * 1 7")
+
+    assert cron.weekdays == {0}
+    assert cron.next_after(datetime(2024, 12, 31, 12, 0)) == datetime(2025, 1, 5, 0, 0)
+
+
+def test_cron_star_step_fields_are_unrestricted():
+    cron = CronSchedule.parse("0 0 */2 * 1")
+
+    assert not cron.days_restricted
+    # Odd day AND Monday: 2024-05-06 is an even Monday, 2024-05-13 an odd one.
+    assert cron.next_after(datetime(2024, 5, 1, 12, 0)) == datetime(2024, 5, 13, 0, 0)
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "*/0 * * * *", "a * * * *"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule.parse(expression)
+
+
+def test_cron_never_matching_expression():
+    with pytest.raises(ValueError):
+        CronSchedule.parse("0 0 31 2 *").next_after(datetime(2024, 1, 1))
+
+
+def test_time_window_wrapping_midnight():
+    window = TimeWindow.parse("23:00-02:00")
+
+    assert window.start == time(23, 0)
+    assert window.length.total_seconds() == 3 * 3600
+    assert window.contains(datetime(2024, 5, 1, 1, 0))
+    assert not window.contains(datetime(2024, 5, 1, 12, 0))
+    assert window.closes_at(datetime(2024, 5, 1, 23, 30)) == datetime(2024, 5, 2, 2, 0)
+    assert window.next_start(datetime(2024, 5, 1, 12, 0)) == datetime(2024, 5, 1, 23, 0)
+
+
+@pytest.mark.parametrize("text", ["01:00", "01:00-01:00", "25:00-02:00"])
+def test_time_window_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        TimeWindow.parse(text)
+
+
+def test_estimator_smooths_previous_runs():
+    estimator = RunDurationEstimator(smoothing=0.5)
+    assert estimator.estimate() is None
+
+    estimator.record(10.0)
+    estimator.record(20.0)
+
+    assert estimator.estimate() == 15.0
+
+
+def test_plan_run_small_runs_ignore_windows():
+    windows = [TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 12, 0)
+
+    assert plan_run(due, windows, estimate=5.0, small_run_seconds=60.0) == due
+
+
+def test_plan_run_large_run_inside_window_runs_now():
+    windows = [TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 2, 0)
+
+    assert plan_run(due, windows, estimate=3600.0, small_run_seconds=60.0) == due
+
+
+def test_plan_run_defers_large_run_that_would_overrun_window():
+    windows = [TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 4, 30)
+
+    planned = plan_run(due, windows, estimate=3600.0, small_run_seconds=60.0)
+
+    assert planned == datetime(2024, 5, 2, 1, 0)
+
+
+def test_plan_run_unknown_estimate_waits_for_window():
+    windows = [TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 12, 0)
+
+    assert plan_run(due, windows, estimate=None, small_run_seconds=60.0) == datetime(
+        2024, 5, 2, 1, 0
+    )
+
+
+def test_plan_run_prefers_window_long_enough():
+    windows = [TimeWindow.parse("13:00-13:30"), TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 12, 0)
+
+    planned = plan_run(due, windows, estimate=3600.0, small_run_seconds=60.0)
+
+    assert planned == datetime(2024, 5, 2, 1, 0)
+
+
+def test_plan_run_jitter_keeps_in_window_run_inside_window():
+    windows = [TimeWindow.parse("01:00-05:00")]
+    due = datetime(2024, 5, 1, 4, 0)
+    rng = random.Random(1234)
+
+    for _ in range(200):
+        planned = plan_run(
+            due,
+            windows,
+            estimate=600.0,
+            small_run_seconds=60.0,
+            jitter_seconds=3600.0,
+            rng=rng,
+        )
+        assert due <= planned <= datetime(2024, 5, 1, 4, 50)
+
+
+def test_plan_run_jitter_leaves_room_to_finish():
+    windows = [TimeWindow.parse("01:00-02:00")]
+    due = datetime(2024, 5, 1, 12, 0)
+    rng = random.Random(1234)
+
+    for _ in range(50):
+        planned = plan_run(
+            due,
+            windows,
+            estimate=3000.0,
+            small_run_seconds=60.0,
+            jitter_seconds=3600.0,
+            rng=rng,
+        )
+        assert datetime(2024, 5, 2, 1, 0) <= planned <= datetime(2024, 5, 2, 1, 10)